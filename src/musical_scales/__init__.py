@@ -1,6 +1,8 @@
 """Retrieve a scale based on a given mode and starting note."""
 
-import math
+import functools
+import sys
+import types
 
 
 class MusicException(Exception):
@@ -9,6 +11,58 @@ class MusicException(Exception):
     pass
 
 
+ACCIDENTALS = frozenset({"#", "b"})
+"""Accidental symbols recognised once ♯ and ♭ are normalised."""
+
+_ACCIDENTAL_TRANS = str.maketrans({"♯": "#", "♭": "b"})
+"""Translation table normalising the unicode accidental symbols."""
+
+LETTER_BASE = (9, 11, 0, 2, 4, 5, 7)
+"""Semitones above C for each natural, indexed by letter: A, B, ..., G."""
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_compound_note_name(compound: str):
+    """Split a compound note name into a name and octave, e.g. ("C#", 4).
+
+    The octave defaults to 3 (the octave of Middle C) when absent:
+        * parse_compound_note_name("C") == ("C", 3)
+        * parse_compound_note_name("eb2") == ("Eb", 2)
+
+    Accepted names follow the grammar [A-Ga-g][#b♯♭]?(-?\\d+)?.
+    Parsing is done character-by-character rather than with a regular
+    expression, since the format is short and fixed. Results are cached,
+    which is safe because the input is a string and the returned tuple
+    is immutable.
+    """
+    name = compound.strip().translate(_ACCIDENTAL_TRANS)
+    if name == "":
+        raise MusicException(f"No note found with name {compound}.")
+    # Clearing bit 5 uppercases an ASCII letter without calling .upper();
+    # the raw bound rejects non-ASCII characters the mask would alias.
+    raw = ord(name[0])
+    code = raw & 0x5F
+    if raw > 122 or code < 65 or code > 71:
+        raise MusicException(f"No note found with name {compound}.")
+    first = chr(code)
+    if len(name) == 1:
+        return first, 3
+    second = name[1]
+    if second in ACCIDENTALS:
+        note_name = first + second
+        rest = name[2:]
+    else:
+        note_name = first
+        rest = name[1:]
+    if rest == "":
+        return note_name, 3
+    try:
+        octave = int(rest)
+    except ValueError:
+        raise MusicException(f"No note found with name {compound}.")
+    return note_name, octave
+
+
 class Note:
     """A single note in a given octave, e.g. C#3.
 
@@ -17,34 +71,46 @@ class Note:
         * Note(2) # D3
     """
 
+    __slots__ = ("semitones_above_middle_c", "name", "octave", "midi")
+
     semitones_above_middle_c: int
     name: str
     octave: int
+    midi: str
 
     def __init__(self, name: str = None, semitones_above_middle_c: int = None):
         """Create a note with a given name or degree.
 
         Examples:
             * Note("C#")
+            * Note("C#4")
+            * Note(2)
             * Note(semitones_above_middle_c = 1)
         """
-        if name is not None:
-            if name not in interval_from_names:
+        if isinstance(name, int):
+            self._set_degree(name)
+        elif name is not None:
+            if not isinstance(name, str):
                 raise MusicException(f"No note found with name {name}.")
-            self._set_degree(interval_from_names[name])
+            note_name, octave = parse_compound_note_name(name)
+            base = LETTER_BASE[ord(note_name[0]) - 65]
+            if len(note_name) > 1:
+                base += 1 if note_name[1] == "#" else -1
+            self._set_degree(base % 12 + (octave - 3) * 12)
         elif semitones_above_middle_c is not None:
             self._set_degree(semitones_above_middle_c)
         else:
             self._set_degree(0)
 
     def _set_degree(self, semitones_above_middle_c: int):
-        """Set the note name and octave.
+        """Set the note name, octave and MIDI-style name (e.g. C3).
 
         Should only be used during initialisation.
         """
         self.semitones_above_middle_c = semitones_above_middle_c
         self.name = names_from_interval[semitones_above_middle_c % 12]
-        self.octave = math.floor(semitones_above_middle_c / 12) + 3
+        self.octave = semitones_above_middle_c // 12 + 3
+        self.midi = sys.intern(f"{self.name}{self.octave}")
 
     def __str__(self):
         """MIDI-style string representation e.g. C#3."""
@@ -54,25 +120,73 @@ class Note:
         """MIDI-style string representation e.g. C#3."""
         return self.midi
 
-    @property
-    def midi(self):
-        """Note name and octave, e.g. C3."""
-        return f"{self.name}{self.octave}"
-
     def __add__(self, shift: int):
         """Shifting this note's degree upwards."""
-        return Note(semitones_above_middle_c=self.semitones_above_middle_c + shift)
+        return _note(self.semitones_above_middle_c + shift)
 
     def __sub__(self, shift: int):
         """Shifting this note's degree downwards."""
         return self + (-shift)
 
     def __eq__(self, other):
-        """Check equality via .midi."""
+        """Check equality against Notes, semitone counts, or names.
+
+        Notes and ints compare by semitones above Middle C; strings
+        compare against either the midi name ("C3") or bare name ("C").
+        """
         if isinstance(other, Note):
-            return self.midi == other.midi
-        else:
+            return self.semitones_above_middle_c == other.semitones_above_middle_c
+        if isinstance(other, int):
+            return self.semitones_above_middle_c == other
+        if isinstance(other, str):
+            # name and midi are interned, so a comparand drawn from
+            # another Note hits on identity before any character compare.
+            if self.midi is other or self.name is other:
+                return True
             return self.midi == other or self.name == other
+        return NotImplemented
+
+    def __hash__(self):
+        """Hash by degree, consistent with equality between Notes."""
+        return hash(self.semitones_above_middle_c)
+
+
+@functools.lru_cache(maxsize=4096)
+def _note(semitones_above_middle_c: int):
+    """Shared Note instance for the given degree.
+
+    Notes are immutable by convention, so code constructing many notes
+    (such as scale()) can reuse one instance per degree rather than
+    allocating a fresh object each time.
+    """
+    return Note(semitones_above_middle_c=semitones_above_middle_c)
+
+
+@functools.lru_cache(maxsize=None)
+def _scale_offsets(mode, octaves):
+    """Cumulative semitone offsets of a scale, starting from 0.
+
+    A scale from any note is a fixed offset pattern plus the starting
+    degree, so the pattern only needs computing once per (mode, octaves)
+    pair; with under fifty modes the cache stays tiny.
+    """
+    if octaves <= 0:
+        # Matches the original loop, which simply ran zero times.
+        return (0,)
+    _load_accelerators()
+    if _scale_semitones_jit is not None:
+        semitones = _scale_semitones_jit(0, _mode_ids[mode], octaves)
+        return tuple(int(semitone) for semitone in semitones)
+    if numpy is not None:
+        tiled = numpy.tile(_scale_intervals_np[mode], octaves)
+        cumulative = numpy.cumsum(tiled, dtype=numpy.int64)
+        return (0,) + tuple(int(offset) for offset in cumulative)
+    offsets = [0]
+    current = 0
+    for interval in scale_intervals[mode] * octaves:
+        current += interval
+        offsets.append(current)
+    return tuple(offsets)
 
 
 def scale(starting_note, mode="ionian", octaves=1):
@@ -86,11 +200,35 @@ def scale(starting_note, mode="ionian", octaves=1):
         raise MusicException(f"The mode {mode} is not available.")
     if not isinstance(starting_note, Note):
         starting_note = Note(starting_note)
-    notes = [starting_note]
-    for octave in range(0, octaves):
-        for interval in scale_intervals[mode]:
-            notes.append(notes[-1] + interval)
-    return notes
+    base = starting_note.semitones_above_middle_c
+    return [starting_note] + [
+        _note(base + offset) for offset in _scale_offsets(mode, octaves)[1:]
+    ]
+
+
+def scale_semitones(starting_note, mode="ionian", octaves=1):
+    """Return a scale as a numpy int16 array of semitones above Middle C.
+
+    For analysis code that works on raw semitone numbers and has no use
+    for Note objects. The starting note may be a Note, a name string, or
+    a number of semitones above Middle C. Requires numpy.
+
+    Example:
+        * scale_semitones("D") # array([2, 4, 6, 7, 9, 11, 13, 14], ...)
+    """
+    _load_accelerators()
+    if numpy is None:
+        raise MusicException("scale_semitones requires numpy.")
+    if mode not in scale_intervals:
+        raise MusicException(f"The mode {mode} is not available.")
+    if isinstance(starting_note, Note):
+        base = starting_note.semitones_above_middle_c
+    elif isinstance(starting_note, int):
+        base = starting_note
+    else:
+        base = Note(starting_note).semitones_above_middle_c
+    offsets = numpy.array(_scale_offsets(mode, octaves), dtype=numpy.int16)
+    return base + offsets
 
 
 # Found at https://en.wikipedia.org/wiki/List_of_musical_scales_and_modes
@@ -148,21 +286,82 @@ scale_intervals = {
 
 scale_intervals["major"] = scale_intervals["ionian"]
 
-names_from_interval = {
-    0: "C",
-    1: "C#",
-    2: "D",
-    3: "D#",
-    4: "E",
-    5: "F",
-    6: "F#",
-    7: "G",
-    8: "G#",
-    9: "A",
-    10: "A#",
-    11: "B"
-}
-"""From an interval give the note name, favouring sharps over flats."""
+# The intervals never change once defined: tuples iterate faster than
+# lists and the read-only view guards against accidental mutation.
+scale_intervals = types.MappingProxyType(
+    {mode: tuple(intervals) for mode, intervals in scale_intervals.items()}
+)
+
+numpy = None
+"""The numpy module once _load_accelerators has run, if installed."""
+
+_scale_semitones_jit = None
+"""JIT-compiled scale generator, set by _load_accelerators via numba."""
+
+_accelerators_loaded = False
+
+
+def _load_accelerators():
+    """Import numpy and numba, if installed, on first use.
+
+    The imports (and numba's first compile) dwarf everything else this
+    module does at start-up, so they stay off the cold
+    `import musical_scales` path and run when the first scale pattern
+    is actually computed.
+    """
+    global _accelerators_loaded, numpy, _scale_intervals_np
+    global _scale_semitones_jit, _mode_ids, _interval_lengths
+    global _intervals_matrix
+    if _accelerators_loaded:
+        return
+    _accelerators_loaded = True
+    try:
+        import numpy
+    except ImportError:
+        return
+    _scale_intervals_np = {
+        mode: numpy.array(intervals, dtype=numpy.int8)
+        for mode, intervals in scale_intervals.items()
+    }
+    try:
+        import numba
+    except ImportError:
+        return
+    _mode_ids = {mode: index for index, mode in enumerate(scale_intervals)}
+    _interval_lengths = numpy.array(
+        [len(intervals) for intervals in scale_intervals.values()],
+        dtype=numpy.int64
+    )
+    _intervals_matrix = numpy.zeros(
+        (len(scale_intervals), int(_interval_lengths.max())),
+        dtype=numpy.int8
+    )
+    for index, intervals in enumerate(scale_intervals.values()):
+        _intervals_matrix[index, :len(intervals)] = intervals
+
+    @numba.njit(cache=True)
+    def _jit(base, mode_id, octaves):
+        """Absolute semitone degrees of a scale, as an int64 array."""
+        length = _interval_lengths[mode_id]
+        out = numpy.empty(1 + octaves * length, dtype=numpy.int64)
+        out[0] = base
+        index = 1
+        for _ in range(octaves):
+            for j in range(length):
+                out[index] = out[index - 1] + _intervals_matrix[mode_id, j]
+                index += 1
+        return out
+
+    _scale_semitones_jit = _jit
+
+names_from_interval = tuple(sys.intern(name) for name in (
+    "C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"
+))
+"""From an interval give the note name, favouring sharps over flats.
+
+A tuple indexed by interval: subscripting it skips the hashing a dict
+lookup would need.
+"""
 
 interval_from_names = {
     "C": 0,
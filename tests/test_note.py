@@ -12,8 +12,30 @@ def test_middle_c():
     b_2 = c_3 -1
     assert b_2.name == "B"
 
+def test_degree_construction():
+    """Notes can be created positionally from a degree."""
+    assert musical_scales.Note(0) == "C3"
+    assert musical_scales.Note(14) == "D4"
+    with pytest.raises(musical_scales.MusicException):
+        musical_scales.Note(1.5)
+
+def test_compound_names():
+    """Notes can be created from names that include an octave."""
+    assert musical_scales.Note("C#4") == "C#4"
+    assert musical_scales.Note("eb2") == "D#2"
+    assert musical_scales.Note("B♭3") == "A#3"
+    with pytest.raises(musical_scales.MusicException):
+        musical_scales.Note("H")
+    with pytest.raises(musical_scales.MusicException):
+        musical_scales.Note("C#x")
+
 def test_equality():
     """Notes should compare permissively."""
     assert musical_scales.Note("C") == musical_scales.Note("C")
     assert musical_scales.Note("C") == "C3"
-    assert musical_scales.Note("C") == "C"
\ No newline at end of file
+    assert musical_scales.Note("C") == "C"
+    assert musical_scales.Note("D") == 2
+
+def test_hashable():
+    """Equal notes should share a hash so they can live in sets."""
+    assert len({musical_scales.Note("C"), musical_scales.Note("C")}) == 1
\ No newline at end of file
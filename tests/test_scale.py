@@ -22,6 +22,18 @@ def test_blues():
     names = list(map(lambda note: note.name, scale_notes))
     assert names == ["C", "D#", "F", "F#", "G", "A#", "C"]
 
+def test_no_octaves():
+    """Non-positive octave counts yield just the starting note."""
+    assert musical_scales.scale("D", octaves=0) == [musical_scales.Note("D")]
+    assert musical_scales.scale("D", octaves=-1) == [musical_scales.Note("D")]
+
+def test_scale_semitones():
+    """The batch API returns raw semitone numbers matching scale()."""
+    pytest.importorskip("numpy")
+    semitones = musical_scales.scale_semitones("D")
+    assert list(semitones) == [2, 4, 6, 7, 9, 11, 13, 14]
+    assert list(musical_scales.scale_semitones(2)) == list(semitones)
+
 def test_major():
     """'major' is a shorthand for ionian in our code."""
     assert musical_scales.scale("D") == musical_scales.scale("D","major")